@@ -1,6 +1,6 @@
 from functools import partial
-from time import time
-from typing import TYPE_CHECKING, cast
+from time import sleep, time
+from typing import TYPE_CHECKING, ClassVar, cast
 
 import qcodes.validators as vals
 from qcodes.instrument import (
@@ -11,6 +11,8 @@ from qcodes.instrument import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from typing_extensions import Unpack
 
     from qcodes.parameters import Parameter
@@ -23,7 +25,20 @@ class HarvardDecadacException(Exception):
 DACException = HarvardDecadacException
 
 
+def _ramp_poll_interval(secs: float) -> float:
+    """
+    Interval in seconds at which to poll the slope of a ramp taking secs
+    seconds to complete.
+    """
+    return max(5e-3, secs / 50)
+
+
 class DacReader:
+    # Maximum number of bytes read in a single chained command
+    _MAX_CHAINED_READS = 16
+    # Maximum number of writes in a single chained command
+    _MAX_CHAINED_WRITES = 16
+
     @staticmethod
     def _dac_parse(resp):
         """
@@ -49,8 +64,9 @@ class DacReader:
                 f"({self.min_val} V - {self.max_val} V)."
             )
 
-        frac = (volt - self.min_val) / (self.max_val - self.min_val)
-        val = round(frac * 65535)
+        # The value is positive here, so adding 0.5 and truncating rounds
+        # to the nearest code (ties rounding up) faster than round
+        val = int((volt - self.min_val) * self._v_to_code_scale + 0.5)
         # extra check to be absolutely sure that the instrument does nothing
         # receive an out-of-bounds value
         if val > 65535 or val < 0:
@@ -66,24 +82,34 @@ class DacReader:
         based on the minimum/maximum values of a given channel.
         Midrange is 32768.
         """
-        frac = code / 65535.0
-        return (frac * (self.max_val - self.min_val)) + self.min_val
+        return code * self._code_to_v_scale + self.min_val
 
     def _set_slot(self):
         """
-        Set the active DAC slot
+        Set the active DAC slot, unless it is already the active slot
         """
+        dac = cast("HarvardDecadac", self.root_instrument)
+        if dac._active_slot == self._slot:
+            return
+        # Forget the active slot until we know the DAC accepted the new one
+        dac._active_slot = dac._active_channel = None
         resp = self.ask_raw(f"B{self._slot};")
         if int(self._dac_parse(resp)) != self._slot:
             raise HarvardDecadacException(
                 "Unexpected return from DAC when setting slot: "
                 f"{resp}. DAC slot may not have been set."
             )
+        dac._active_slot = self._slot
 
     def _set_channel(self):
         """
-        Set the active DAC channel
+        Set the active DAC channel, unless it is already the active channel
         """
+        dac = cast("HarvardDecadac", self.root_instrument)
+        if dac._active_slot == self._slot and dac._active_channel == self._channel:
+            return
+        # Forget the active channel until we know the DAC accepted the new one
+        dac._active_slot = dac._active_channel = None
         resp = self.ask_raw(f"B{self._slot};C{self._channel};")
         if resp.strip() != f"B{self._slot}!C{self._channel}!":
             raise HarvardDecadacException(
@@ -91,6 +117,28 @@ class DacReader:
                 f"channel: {resp}. DAC channel may not have "
                 f"been set."
             )
+        dac._active_slot = self._slot
+        dac._active_channel = self._channel
+
+    def _invalidate_selection(self, cmd: str) -> None:
+        """
+        Forget the cached active slot and channel if the given command may
+        select a different slot or channel.
+        """
+        if "B" in cmd or "C" in cmd:
+            dac = cast("HarvardDecadac", self.root_instrument)  # type: ignore[attr-defined]
+            dac._active_slot = dac._active_channel = None
+
+    def _invalidate_last_codes(self, cmd: str) -> None:
+        """
+        Forget the DAC codes last set by the driver on all channels if the
+        given command may change the output of a channel.
+        """
+        if any(command in cmd for command in "DSUL"):
+            dac = cast("HarvardDecadac", self.root_instrument)  # type: ignore[attr-defined]
+            if "channels" in dac.submodules:
+                for chan in dac.channels:
+                    chan._last_code = None
 
     def _query_address(self, addr: int, count: int = 1, versa_eeprom: bool = False):
         """
@@ -104,15 +152,34 @@ class DacReader:
             versa_eeprom(bool): do we want to read from the versadac
             (slot) EEPROM
 
+        """
+        return self._query_addresses([addr], count, versa_eeprom)[0]
+
+    def _query_addresses(
+        self, addrs: "Sequence[int]", count: int = 1, versa_eeprom: bool = False
+    ) -> list[int]:
+        """
+        Query the values at the dac addresses given, chaining as many queries
+        as possible in a single command.
+
+        Args:
+            addrs: The addresses to query.
+
+            count: The number of bytes to query at each address.
+
+            versa_eeprom: do we want to read from the versadac
+            (slot) EEPROM
+
         """
         # Check if we actually have anything to query
-        if count == 0:
-            return 0
+        if count == 0 or not addrs:
+            return [0] * len(addrs)
 
-        # Validate address
-        addr = int(addr)
-        if addr < 0 or addr > 1107296266:
-            raise HarvardDecadacException(f"Invalid address {addr}.")
+        # Validate addresses
+        addrs = [int(addr) for addr in addrs]
+        for addr in addrs:
+            if addr < 0 or addr > 1107296266:
+                raise HarvardDecadacException(f"Invalid address {addr}.")
 
         # Choose a poke command depending on whether we are querying a
         # VERSADAC eeprom or main memory
@@ -123,6 +190,45 @@ class DacReader:
         else:
             query_command = "p;"
 
+        addrs_per_query = max(1, self._MAX_CHAINED_READS // max(count, 1))
+        values: list[int] = []
+        for start in range(0, len(addrs), addrs_per_query):
+            chunk = addrs[start : start + addrs_per_query]
+            # Point the DAC at each address and read it back in a single
+            # chained command, the response takes the form
+            # "A<addr>!p<val>!A<addr>!..."
+            byte_addrs = [addr + i for addr in chunk for i in range(count)]
+            cmd = "".join(f"A{addr};{query_command}" for addr in byte_addrs)
+            resp = self.ask_raw(cmd)  # type: ignore[attr-defined]
+            parts = [part for part in resp.strip().split("!") if part]
+            if len(parts) != 2 * len(byte_addrs):
+                # Firmware did not answer all chained commands, read byte by
+                # byte
+                values.extend(
+                    self._query_address_bytewise(addr, count, query_command)
+                    for addr in chunk
+                )
+                continue
+
+            # Convert the bytes read from the device to an int per address
+            for i, addr in enumerate(chunk):
+                val = 0
+                for j in range(count):
+                    k = 2 * (i * count + j)
+                    if int(parts[k][1:]) != addr + j:
+                        raise HarvardDecadacException(
+                            f"Failed to set EEPROM address {addr + j}."
+                        )
+                    val += int(parts[k + 1][1:]) << (32 * (count - j - 1))
+                values.append(val)
+
+        return values
+
+    def _query_address_bytewise(self, addr: int, count: int, query_command: str):
+        """
+        Query the value at the dac address given, setting the address and
+        reading each byte in a separate command.
+        """
         # Read a number of bytes from the device and convert to an int
         val = 0
         for i in range(count):
@@ -198,6 +304,15 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
     """
 
     _CHANNEL_VAL = vals.Ints(0, 3)
+    # Offsets from the channel base address of the values read by the channel
+    # parameters, and the number of bytes to read
+    _PARAM_TABLE: ClassVar[dict[str, tuple[int, int]]] = {
+        "update_period": (0, 1),
+        "upper_ramp_limit": (4, 1),
+        "lower_ramp_limit": (5, 1),
+        "slope": (6, 2),
+        "volt": (9, 1),
+    }
 
     def __init__(
         self, parent: "HarvardDecadacSlot", name: str, channel, min_val=-5, max_val=5
@@ -222,6 +337,12 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
         assert min_val < max_val
         self.min_val = min_val
         self.max_val = max_val
+        # The last DAC code set by the driver, None if unknown, for example
+        # while ramping
+        self._last_code: int | None = None
+        # Precompute the factors to convert between voltages and DAC codes
+        self._v_to_code_scale = 65535.0 / (max_val - min_val)
+        self._code_to_v_scale = (max_val - min_val) / 65535.0
 
         # Add channel parameters
         # Note we will use the older addresses to read the value from the dac
@@ -229,7 +350,7 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
         self._volt_val = vals.Numbers(self.min_val, self.max_val)
         self.volt: Parameter = self.add_parameter(
             "volt",
-            get_cmd=partial(self._query_address, self._base_addr + 9, 1),
+            get_cmd=self._get_volt,
             get_parser=self._dac_code_to_v,
             set_cmd=self._set_dac,
             set_parser=self._dac_v_to_code,
@@ -242,7 +363,7 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
         # safety features.
         self.lower_ramp_limit: Parameter = self.add_parameter(
             "lower_ramp_limit",
-            get_cmd=partial(self._query_address, self._base_addr + 5),
+            get_cmd=self._get_lower_ramp_limit,
             get_parser=self._dac_code_to_v,
             set_cmd="L{};",
             set_parser=self._dac_v_to_code,
@@ -253,7 +374,7 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
         """Parameter lower_ramp_limit"""
         self.upper_ramp_limit: Parameter = self.add_parameter(
             "upper_ramp_limit",
-            get_cmd=partial(self._query_address, self._base_addr + 4),
+            get_cmd=self._get_upper_ramp_limit,
             get_parser=self._dac_code_to_v,
             set_cmd="U{};",
             set_parser=self._dac_v_to_code,
@@ -264,7 +385,7 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
         """Parameter upper_ramp_limit"""
         self.update_period: Parameter = self.add_parameter(
             "update_period",
-            get_cmd=partial(self._query_address, self._base_addr),
+            get_cmd=self._get_update_period,
             get_parser=int,
             set_cmd="T{};",
             set_parser=int,
@@ -275,7 +396,7 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
         """Parameter update_period"""
         self.slope: Parameter = self.add_parameter(
             "slope",
-            get_cmd=partial(self._query_address, self._base_addr + 6, 2),
+            get_cmd=self._get_slope,
             get_parser=int,
             set_cmd="S{};",
             set_parser=int,
@@ -329,6 +450,30 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
             )
             """Parameter initial_value"""
 
+    # The channel parameters use bound methods rather than partials as get_cmd
+    # since those are much cheaper to inspect when the parameter is created
+    def _get_volt(self):
+        return self._query_param("volt")
+
+    def _get_lower_ramp_limit(self):
+        return self._query_param("lower_ramp_limit")
+
+    def _get_upper_ramp_limit(self):
+        return self._query_param("upper_ramp_limit")
+
+    def _get_update_period(self):
+        return self._query_param("update_period")
+
+    def _get_slope(self):
+        return self._query_param("slope")
+
+    def _query_param(self, name):
+        """
+        Query the raw value of a channel parameter from the DAC
+        """
+        offset, count = self._PARAM_TABLE[name]
+        return self._query_address(self._base_addr + offset, count)
+
     def _ramp(self, val, rate, block=True):
         """
         Ramp the DAC to a given voltage.
@@ -340,17 +485,82 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
 
             block (bool): Should the call block until the ramp is complete?
         """
+        secs = self._start_ramp(val, rate)
+
+        # Block until the ramp is complete is block is True, polling at an
+        # interval scaled to the ramp duration to not flood the serial line
+        if block and secs > 0:
+            poll_interval = _ramp_poll_interval(secs)
+            while self.slope.get() != 0:
+                sleep(poll_interval)
+            self._last_code = self._dac_v_to_code(val)
+
+    def _start_ramp(self, val, rate):
+        """
+        Start ramping the DAC to a given voltage without waiting for the ramp
+        to complete.
+
+        Params:
+            val (float): The voltage to ramp to in volts
+
+            rate (float): The ramp rate in units of volts/s
+
+        Returns:
+            The expected duration of the ramp in seconds, 0 if no ramp was
+            started.
+
+        """
+        slope, secs = self._ramp_slope(val, rate)
+        if secs == 0:
+            return 0
+
+        # Now let's set up our limits and ramo slope. The DAC value is unknown
+        # while ramping.
+        self._last_code = None
+        if slope > 0:
+            self.upper_ramp_limit.set(val)
+        else:
+            self.lower_ramp_limit.set(val)
+        self.slope.set(slope)
+
+        return secs
+
+    def _ramp_slope(self, val, rate):
+        """
+        Calculate the slope needed to ramp the DAC to a given voltage.
+
+        Params:
+            val (float): The voltage to ramp to in volts
+
+            rate (float): The ramp rate in units of volts/s
+
+        Returns:
+            The slope and the expected duration of the ramp in seconds. Both
+            are 0 if the DAC is already at the given voltage.
+
+        """
 
         # We need to know the current dac value (in raw units), as well as the
-        # update rate
-        c_volt = self.volt.get()  # Current Voltage
-        if c_volt == val:
-            # If we are already at the right voltage, we don't need to ramp
-            return
-        c_val = self._dac_v_to_code(c_volt)  # Current voltage in DAC units
+        # update rate. If the current value was set by the driver itself, the
+        # update rate is only read once a ramp is needed, otherwise both are
+        # read at once.
         e_val = self._dac_v_to_code(val)  # Endpoint in DAC units
+        c_val = self._last_code  # Current voltage in DAC units
+        if c_val is None:
+            c_val, update_period = self._query_addresses(
+                [
+                    self._base_addr + self._PARAM_TABLE["volt"][0],
+                    self._base_addr + self._PARAM_TABLE["update_period"][0],
+                ]
+            )
+        elif c_val != e_val:
+            update_period = self._query_param("update_period")
+        if c_val == e_val:
+            # If we are already at the right voltage, we don't need to ramp
+            return 0, 0
+        c_volt = self._dac_code_to_v(c_val)  # Current Voltage
         # Number of refreshes per second
-        t_rate = 1 / (self.update_period.get() * 1e-6)
+        t_rate = 1 / (update_period * 1e-6)
         # Number of seconds to ramp
         secs = abs((c_volt - val) / rate)
 
@@ -358,17 +568,7 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
         # the number of time steps in the ramp multiplied by 65536
         slope = int(((e_val - c_val) / (t_rate * secs)) * 65536)
 
-        # Now let's set up our limits and ramo slope
-        if slope > 0:
-            self.upper_ramp_limit.set(val)
-        else:
-            self.lower_ramp_limit.set(val)
-        self.slope.set(slope)
-
-        # Block until the ramp is complete is block is True
-        if block:
-            while self.slope.get() != 0:
-                pass
+        return slope, secs
 
     def _set_dac(self, code):
         """
@@ -383,7 +583,9 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
         else:
             code = int(code)
             self._set_channel()
+            self._last_code = None
             self.ask_raw(f"U65535;L0;D{code};")
+            self._last_code = code
 
     def write(self, cmd):
         """
@@ -392,6 +594,9 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
         as well, otherwise commands receive the wrong response.
         """
         self._set_channel()
+        self._invalidate_selection(cmd)
+        # Any channel command may change the output, e.g. D, S, U or L
+        self._last_code = None
         return self.ask_raw(cmd)
 
     def ask(self, cmd):
@@ -399,6 +604,9 @@ class HarvardDecadacChannel(InstrumentChannel, DacReader):
         Overload ask to set channel prior to operations
         """
         self._set_channel()
+        self._invalidate_selection(cmd)
+        # Any channel command may change the output, e.g. D, S, U or L
+        self._last_code = None
         return self.ask_raw(cmd)
 
 
@@ -469,6 +677,8 @@ class HarvardDecadacSlot(InstrumentChannel, DacReader):
         as well, otherwise commands receive the wrong response.
         """
         self._set_slot()
+        self._invalidate_selection(cmd)
+        self._invalidate_last_codes(cmd)
         return self.ask_raw(cmd)
 
     def ask(self, cmd):
@@ -476,6 +686,8 @@ class HarvardDecadacSlot(InstrumentChannel, DacReader):
         Overload ask to set channel prior to operations
         """
         self._set_slot()
+        self._invalidate_selection(cmd)
+        self._invalidate_last_codes(cmd)
         return self.ask_raw(cmd)
 
 
@@ -531,7 +743,13 @@ class HarvardDecadac(VisaInstrument, DacReader):
 
         super().__init__(name, address, **kwargs)
 
+        # The slot and channel the DAC currently points to, used to avoid
+        # selecting the same slot or channel again. None if unknown.
+        self._active_slot: int | None = None
+        self._active_channel: int | None = None
+
         # Do feature detection
+        self._features_detected = False
         self._feature_detect()
 
         # Create channels
@@ -561,6 +779,30 @@ class HarvardDecadac(VisaInstrument, DacReader):
         for chan in self.channels:
             chan.volt.set(volt)
 
+    def set_all_fast(self, volt: float) -> None:
+        """
+        Set all dac channels to a specific voltage using as few chained
+        commands as possible. Unlike :meth:`set_all` the channels always jump to the
+        voltage, regardless of whether they are set to ramp.
+
+        Args:
+            volt(float): The voltage to set all gates to.
+
+        """
+        # Convert first, so that nothing is sent if any channel can not be set
+        codes = [chan._dac_v_to_code(volt) for chan in self.channels]
+        for chan in self.channels:
+            chan._last_code = None
+        self._ask_chained(
+            [
+                f"B{chan._slot};C{chan._channel};U65535;L0;D{code};"
+                for chan, code in zip(self.channels, codes)
+            ]
+        )
+        for chan, code in zip(self.channels, codes):
+            chan._last_code = code
+            chan.volt.cache.set(volt)
+
     def ramp_all(self, volt, ramp_rate):
         """
         Ramp all dac channels to a specific voltage at the given rate
@@ -574,15 +816,72 @@ class HarvardDecadac(VisaInstrument, DacReader):
             ramp_rate(float): The rate in volts per second to ramp
 
         """
-        # Start all channels ramping
+        # Work out the ramp of all channels and start them ramping in as few
+        # chained commands as possible
+        ramping = []
+        slopes = []
+        ramp_secs = []
+        cmds = []
         for chan in self.channels:
-            chan._ramp(volt, ramp_rate, block=False)
-
-        # Wait for all channels to complete ramping.
-        # The slope is reset to 0 once ramping is complete.
-        for chan in self.channels:
-            while chan.slope.get():
-                pass
+            slope, secs = chan._ramp_slope(volt, ramp_rate)
+            if secs == 0:
+                continue
+            limit = "U" if slope > 0 else "L"
+            cmds.append(
+                f"B{chan._slot};C{chan._channel};"
+                f"{limit}{chan._dac_v_to_code(volt)};S{slope};"
+            )
+            ramping.append(chan)
+            slopes.append(slope)
+            ramp_secs.append(secs)
+            chan._last_code = None
+        if not ramping:
+            return
+        self._ask_chained(cmds)
+        for chan, slope in zip(ramping, slopes):
+            limit_param = chan.upper_ramp_limit if slope > 0 else chan.lower_ramp_limit
+            limit_param.cache.set(volt)
+            chan.slope.cache.set(slope)
+
+        # Wait for all channels to complete ramping, polling the channels
+        # round-robin. The slope is reset to 0 once ramping is complete.
+        poll_interval = _ramp_poll_interval(max(ramp_secs))
+        pending = ramping
+        while True:
+            pending = [chan for chan in pending if chan.slope.get()]
+            if not pending:
+                break
+            sleep(poll_interval)
+        for chan in ramping:
+            chan._last_code = chan._dac_v_to_code(volt)
+
+    def _ask_chained(self, cmds: "Sequence[str]") -> None:
+        """
+        Send groups of chained commands to the DAC, combining as many groups
+        as fit in ``_MAX_CHAINED_WRITES`` commands in a single transaction,
+        and check that each of the commands was answered. A group is never
+        split over several transactions.
+        """
+        chunk = ""
+        for cmd in cmds:
+            if chunk and chunk.count(";") + cmd.count(";") > self._MAX_CHAINED_WRITES:
+                self._ask_chunk(chunk)
+                chunk = ""
+            chunk += cmd
+        if chunk:
+            self._ask_chunk(chunk)
+
+    def _ask_chunk(self, cmd: str) -> None:
+        """
+        Send chained commands in a single transaction and check that each of
+        them was answered.
+        """
+        self._invalidate_selection(cmd)
+        resp = self.ask_raw(cmd)
+        if resp.count("!") != cmd.count(";"):
+            raise HarvardDecadacException(
+                f"Unexpected return from DAC for chained command {cmd}: {resp}"
+            )
 
     def get_idn(self):
         """
@@ -622,18 +921,22 @@ class HarvardDecadac(VisaInstrument, DacReader):
         """Simplified repr giving just the class and name."""
         return f"<{type(self).__name__}: {self.name}>"
 
-    def _feature_detect(self):
+    def _feature_detect(self, force: bool = False) -> None:
         """
         Detect which features are available on the DAC by querying various
-        parameters.
+        parameters. The features are only detected once unless force is True.
         """
+        if self._features_detected and not force:
+            return
 
-        # Check whether EEPROM is installed
+        # Check whether EEPROM is installed, reading the DAC version and S/N
+        # in the same command. These are only valid if the EEPROM is
+        # queryable.
         try:
-            if self._query_address(1107296256) == 21930:
-                self._EEPROM_available = True
-            else:
-                self._EEPROM_available = False
+            eeprom_id, version, serial_no = self._query_addresses(
+                [1107296256, 1107296266, 1107296264]
+            )
+            self._EEPROM_available = eeprom_id == 21930
         except HarvardDecadacException:
             self._EEPROM_available = False
 
@@ -660,15 +963,16 @@ class HarvardDecadac(VisaInstrument, DacReader):
         except HarvardDecadacException:
             self._cal_supported = False
 
-        # Finally try and read the DAC version and S/N.
-        # This is only possible if the EEPROM is queryable.
+        # Finally store the DAC version and S/N.
         if self._EEPROM_available:
-            self.version = self._query_address(1107296266)
-            self.serial_no = self._query_address(1107296264)
+            self.version = version
+            self.serial_no = serial_no
         else:
             self.version = 0
             self.serial_no = 0
 
+        self._features_detected = True
+
     def write(self, cmd):
         """
         Since all commands are echoed back, we must keep track of responses
@@ -677,5 +981,14 @@ class HarvardDecadac(VisaInstrument, DacReader):
         """
         return self.ask(cmd)
 
+    def ask(self, cmd):
+        """
+        Overload ask to keep track of the active slot and channel and of the
+        DAC codes set on the channels
+        """
+        self._invalidate_selection(cmd)
+        self._invalidate_last_codes(cmd)
+        return super().ask(cmd)
+
 
 Decadac = HarvardDecadac
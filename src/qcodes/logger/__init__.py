@@ -12,6 +12,7 @@ and functions to extract log messages to :class:`pandas.DataFrame` s
 from .instrument_logger import filter_instrument, get_instrument_logger
 from .log_analysis import (
     capture_dataframe,
+    log_timestamps,
     log_to_dataframe,
     logfile_to_dataframe,
     time_difference,
@@ -44,6 +45,7 @@ __all__ = [
     "get_level_name",
     "get_log_file_name",
     "handler_level",
+    "log_timestamps",
     "log_to_dataframe",
     "logfile_to_dataframe",
     "start_all_logging",
@@ -7,16 +7,16 @@ exports of logs and log files to a :class:`pd.DataFrame`
 
 from __future__ import annotations
 
+import csv
 import io
 import logging
+import re
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
 
-    import numpy as np
-    import numpy.typing as npt
     import pandas as pd
 
 from .logger import (
@@ -27,9 +27,17 @@ from .logger import (
     get_log_file_name,
 )
 
+_UNIT_SEPARATOR = "\x1f"
+_ESCAPE_CHAR = "\x1e"
+_LOG_LINE_PATTERN = re.compile(r"^\d.*$", flags=re.MULTILINE)
+# formatter shared by all handlers of capture_dataframe
+_FORMATTER = get_formatter()
+# asctime as formatted by logging.Formatter with the msecs separated by "."
+_ASCTIME_FORMAT = f"{logging.Formatter.default_time_format}.%f"
+
 
 def log_to_dataframe(
-    log: Sequence[str],
+    log: str | Sequence[str],
     columns: Sequence[str] | None = None,
     separator: str | None = None,
 ) -> pd.DataFrame:
@@ -44,8 +52,12 @@ def log_to_dataframe(
     :func:`qcodes.logger.logger.start_logger`
     Traceback messages are also logged. These start with a digit.
 
+    Separators beyond the number of columns are kept as part of the last
+    column, i.e. the message.
+
     Args:
-        log: Log content.
+        log: Log content, either as a sequence of lines or as a single
+            string.
         columns: Column headers for the returned dataframe, defaults to
             columns used by handlers set up by
             :func:`qcodes.logger.logger.start_logger`.
@@ -56,20 +68,166 @@ def log_to_dataframe(
     Returns:
         A :class:`pd.DataFrame` containing the log content.
 
+    """
+    separator = separator or LOGGING_SEPARATOR
+    columns = list(columns or FORMAT_STRING_DICT.keys())
+
+    return _lines_to_dataframe(_log_lines(log), columns, separator)
+
+
+def log_timestamps(
+    log: str | Sequence[str],
+    separator: str | None = None,
+) -> pd.Series:
+    """
+    Return the time stamps of the provided log as a :class:`pd.Series`.
+
+    Only the first column of each line is extracted, so this should be
+    preferred over ``log_to_dataframe(log)["asctime"]`` when only the time
+    stamps are needed, for example to pass them to :func:`time_difference`.
+
+    Like :func:`log_to_dataframe` only lines starting with a digit are
+    used, which skips tracebacks.
+
+    Args:
+        log: Log content, either as a sequence of lines or as a single
+            string.
+        separator: Separator of the log file to separate the columns, defaults
+            to separator used by handlers set up by
+            :func:`qcodes.logger.logger.start_logger`.
+
+    Returns:
+        A :class:`pd.Series` containing the time stamps of the log.
+
     """
     import pandas as pd
 
     separator = separator or LOGGING_SEPARATOR
-    columns = columns or list(FORMAT_STRING_DICT.keys())
-    # note: if we used commas as separators, pandas read_csv
-    # could be faster than this string comprehension
+    timestamps = [line.partition(separator)[0] for line in _log_lines(log)]
+    return pd.Series(
+        timestamps, name=next(iter(FORMAT_STRING_DICT)), dtype="string[pyarrow]"
+    )
 
-    split_cont = [
-        line.split(separator) for line in log if line[0].isdigit()
-    ]  # avoid tracebacks
-    dataframe = pd.DataFrame(split_cont, columns=list(columns))
 
-    return dataframe
+def _log_lines(log: str | Sequence[str]) -> list[str]:
+    """
+    Return the lines of the log starting with a digit, which skips
+    tracebacks. Lines are only terminated by a newline, optionally preceded
+    by a carriage return, so that a bare carriage return in a message does
+    not start a new line.
+    """
+    text = log if isinstance(log, str) else "\n".join(log)
+    lines = _LOG_LINE_PATTERN.findall(text)
+    if "\r" in text:
+        lines = [line.removesuffix("\r") for line in lines]
+    return lines
+
+
+def _lines_to_dataframe(
+    lines: Sequence[str], columns: list[str], separator: str
+) -> pd.DataFrame:
+    """
+    Parse already filtered log lines into a :class:`pd.DataFrame` using the
+    C tokenizer of :func:`pd.read_csv`.
+    """
+    if any(_UNIT_SEPARATOR in line or _ESCAPE_CHAR in line for line in lines):
+        prepared = [_tokenizer_line(line, separator, len(columns)) for line in lines]
+    else:
+        # inlined fast path of _tokenizer_line
+        maxsplit = len(columns) - 1
+        prepared = [
+            line.replace(separator, _UNIT_SEPARATOR, maxsplit) for line in lines
+        ]
+    return _read_log(io.StringIO("\n".join(prepared)), columns)
+
+
+def _tokenizer_line(line: str, separator: str, n_columns: int) -> str:
+    """
+    Prepare a log line for the C tokenizer, which only supports single
+    character separators. The first ``n_columns - 1`` separators are
+    replaced by an ASCII unit separator, so any further separators are
+    kept as part of the last column (the message). Unit separators already
+    in the line are escaped.
+    """
+    if _UNIT_SEPARATOR in line or _ESCAPE_CHAR in line:
+        fields = line.split(separator, n_columns - 1)
+        return _UNIT_SEPARATOR.join(
+            field.replace(_ESCAPE_CHAR, _ESCAPE_CHAR * 2).replace(
+                _UNIT_SEPARATOR, _ESCAPE_CHAR + _UNIT_SEPARATOR
+            )
+            for field in fields
+        )
+    return line.replace(separator, _UNIT_SEPARATOR, n_columns - 1)
+
+
+class _LogLineReader:
+    """
+    Minimal file like wrapper around an iterable of log lines (such as an
+    open log file) that only passes on lines starting with a digit, prepared
+    by :func:`_tokenizer_line`. This lets :func:`pd.read_csv` consume a log
+    file lazily without materializing all lines in a list. Like
+    :func:`_log_lines` a carriage return is only stripped before a newline.
+    """
+
+    def __init__(self, lines: Iterable[str], separator: str, n_columns: int) -> None:
+        self._lines = (
+            _tokenizer_line(
+                line[:-2] + "\n" if line.endswith("\r\n") else line,
+                separator,
+                n_columns,
+            )
+            for line in lines
+            if line[:1].isdigit()
+        )
+
+    def read(self, size: int = -1) -> str:
+        chunks = []
+        n_read = 0
+        for line in self._lines:
+            chunks.append(line)
+            n_read += len(line)
+            if 0 <= size <= n_read:
+                break
+        return "".join(chunks)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._lines
+
+
+def _read_log(
+    buffer: io.StringIO | _LogLineReader,
+    columns: list[str],
+) -> pd.DataFrame:
+    import pandas as pd
+
+    try:
+        # _LogLineReader only implements the part of the file protocol
+        # used by the tokenizers
+        dataframe = pd.read_csv(  # type: ignore[call-overload]
+            buffer,
+            sep=_UNIT_SEPARATOR,
+            header=None,
+            names=columns,
+            index_col=False,
+            lineterminator="\n",
+            engine="c",
+            dtype=str,
+            quoting=csv.QUOTE_NONE,
+            escapechar=_ESCAPE_CHAR,
+            na_filter=False,
+        )
+    except pd.errors.EmptyDataError:
+        dataframe = pd.DataFrame(columns=columns)
+
+    return _to_arrow_strings(dataframe)
+
+
+def _to_arrow_strings(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert all columns of the dataframe to pyarrow backed strings, which
+    are more compact and faster to operate on than python strings.
+    """
+    return dataframe.astype("string[pyarrow]")
 
 
 def logfile_to_dataframe(
@@ -88,6 +246,9 @@ def logfile_to_dataframe(
     :func:`qcodes.logger.logger.start_logger`
     Traceback messages are also logged. These start with a digit.
 
+    Separators beyond the number of columns are kept as part of the last
+    column, i.e. the message.
+
     Args:
         logfile: Name of the logfile, defaults to current default log file.
         columns: Column headers for the returned dataframe, defaults to
@@ -103,10 +264,11 @@ def logfile_to_dataframe(
 
     """
     logfile = logfile or get_log_file_name()
-    with open(logfile) as f:
-        raw_cont = f.readlines()
-
-    return log_to_dataframe(raw_cont, columns, separator)
+    separator = separator or LOGGING_SEPARATOR
+    columns = list(columns or FORMAT_STRING_DICT.keys())
+    # only split lines on newlines, see _log_lines
+    with open(logfile, newline="\n") as f:
+        return _read_log(_LogLineReader(f, separator, len(columns)), columns)
 
 
 def time_difference(
@@ -129,34 +291,58 @@ def time_difference(
     """
     import pandas as pd
 
-    if "," in firsttimes.iloc[0]:
-        nfirsttimes = firsttimes.str.replace(",", ".")
-    else:
-        nfirsttimes = firsttimes
-
-    if "," in secondtimes.iloc[0]:
-        nsecondtimes = secondtimes.str.replace(",", ".")
-    else:
-        nsecondtimes = secondtimes
-
-    t0s = nfirsttimes.astype("datetime64[ns]")
-    t1s = nsecondtimes.astype("datetime64[ns]")
-    t1s_np: npt.NDArray[np.datetime64] = t1s.to_numpy()
-    t0s_np: npt.NDArray[np.datetime64] = t0s.to_numpy()
-    timedeltas = (t1s_np - t0s_np).astype("float") * 1e-9
+    t0s = _parse_asctime(firsttimes)
+    t1s = _parse_asctime(secondtimes)
+    timedeltas = (t1s - t0s).total_seconds()
 
     if use_first_series_labels:
-        output = pd.Series(timedeltas, index=nfirsttimes.index)
+        output = pd.Series(timedeltas, index=firsttimes.index)
     else:
-        output = pd.Series(timedeltas, index=nsecondtimes.index)
+        output = pd.Series(timedeltas, index=secondtimes.index)
 
     return output
 
 
+def _parse_asctime(times: pd.Series) -> pd.DatetimeIndex:
+    """
+    Parse a series of time stamp strings, as written by the handlers set up
+    by :func:`qcodes.logger.logger.start_logger`, into a
+    :class:`pd.DatetimeIndex`. The known format is tried first since that
+    avoids guessing the format of every time stamp. Otherwise each time stamp
+    is parsed separately, as they are not necessarily formatted alike.
+    """
+    import pandas as pd
+
+    # check all time stamps since they are not necessarily formatted alike
+    if times.str.contains(",", regex=False).any():
+        times = times.str.replace(",", ".", regex=False)
+    ntimes = pd.Index(times)
+    try:
+        return pd.to_datetime(ntimes, format=_ASCTIME_FORMAT, cache=True)
+    except ValueError:
+        return pd.DatetimeIndex(ntimes.astype("datetime64[ns]"))
+
+
+class _ListHandler(logging.Handler):
+    """
+    Handler that stores the formatted log records in a list.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.records.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
 @contextmanager
 def capture_dataframe(
     level: LevelType = logging.DEBUG, logger: logging.Logger | None = None
-) -> Iterator[tuple[logging.StreamHandler, Callable[[], pd.DataFrame]]]:
+) -> Iterator[tuple[logging.Handler, Callable[[], pd.DataFrame]]]:
     """
     Context manager to capture the logs in a :class:`pd.DataFrame`
 
@@ -178,16 +364,15 @@ def capture_dataframe(
     """
     # get root logger if none is specified.
     logger = logger or logging.getLogger()
-    with io.StringIO() as log_capture:
-        string_handler = logging.StreamHandler(log_capture)
-        string_handler.setLevel(level)
-        string_handler.setFormatter(get_formatter())
-
-        logger.addHandler(string_handler)
-        try:
-            yield (
-                string_handler,
-                lambda: log_to_dataframe(log_capture.getvalue().splitlines()),
-            )
-        finally:
-            logger.removeHandler(string_handler)
+    list_handler = _ListHandler()
+    list_handler.setLevel(level)
+    list_handler.setFormatter(_FORMATTER)
+
+    logger.addHandler(list_handler)
+    try:
+        yield (
+            list_handler,
+            lambda: log_to_dataframe(list_handler.records),
+        )
+    finally:
+        logger.removeHandler(list_handler)
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from qcodes.instrument_drivers.Harvard import (
+    HarvardDecadac,
+    HarvardDecadacException,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+class HarvardDecadacMock(HarvardDecadac):
+    """
+    HarvardDecadac with ask_raw replaced by a minimal simulation of the DAC
+    that echoes every semicolon terminated command as ``X<val>!`` and reads
+    values from a dictionary of addresses.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # EEPROM id, hardware version and serial number
+        self.memory: dict[int, int] = {
+            1107296256: 21930,
+            1107296266: 14081,
+            1107296264: 139,
+        }
+        self.commands: list[str] = []
+        # number of commands answered per ask_raw, None for all of them
+        self.max_answers: int | None = None
+        # address echoed in place of the address set, if not None
+        self.echo_addr: int | None = None
+        self._sim_addr = 0
+        self._sim_slot = 0
+        self._sim_channel = 0
+        super().__init__(*args, **kwargs)
+
+    def ask_raw(self, cmd: str) -> str:
+        self.commands.append(cmd)
+        resp = ""
+        for sub_cmd in [sub_cmd for sub_cmd in cmd.split(";") if sub_cmd][
+            : self.max_answers
+        ]:
+            name, val = sub_cmd[0], sub_cmd[1:]
+            if name == "A":
+                self._sim_addr = int(val)
+                if self.echo_addr is not None:
+                    val = str(self.echo_addr)
+            elif name == "B":
+                self._sim_slot = int(val)
+            elif name == "C":
+                self._sim_channel = int(val)
+            elif name == "D":
+                self.memory[self._chan_addr() + 9] = int(val)
+            elif name == "k":
+                # calibration supported
+                val = "1"
+            elif name in "pe":
+                val = str(self.memory.get(self._sim_addr, 0))
+            resp += f"{name}{val}!"
+        return resp
+
+    def _chan_addr(self) -> int:
+        return 1536 + 64 * self._sim_slot + 16 * self._sim_channel
+
+
+@pytest.fixture(name="dac")
+def _make_dac() -> Generator[HarvardDecadacMock, None, None]:
+    dac = HarvardDecadacMock(
+        "decadac",
+        "GPIB::8::INSTR",
+        pyvisa_sim_file="dummy.yaml",
+        device_clear=False,
+    )
+    dac.commands.clear()
+    try:
+        yield dac
+    finally:
+        dac.close()
+
+
+def test_feature_detect(dac: HarvardDecadacMock) -> None:
+    assert dac.get_idn() == {"serial": 139, "hardware_version": 14081}
+
+
+def test_query_multi_byte_address(dac: HarvardDecadacMock) -> None:
+    chan = dac.channels[5]
+    base = chan._base_addr
+    dac.memory[base + 6] = 1
+    dac.memory[base + 7] = 2
+
+    assert chan.slope.get() == (1 << 32) + 2
+    assert dac.commands == [f"A{base + 6};p;A{base + 7};p;"]
+
+
+def test_query_address_echo_mismatch_raises(dac: HarvardDecadacMock) -> None:
+    dac.echo_addr = 0
+    with pytest.raises(HarvardDecadacException, match="Failed to set EEPROM"):
+        dac._query_address(1536)
+
+
+def test_query_address_falls_back_to_bytewise(dac: HarvardDecadacMock) -> None:
+    dac.max_answers = 1
+    dac.memory[1542] = 1
+    dac.memory[1543] = 2
+
+    assert dac._query_address(1542, 2) == (1 << 32) + 2
+    assert dac.commands[1:] == ["A1542;", "p;", "A1543;", "p;"]
+
+
+def test_query_addresses_is_chunked(dac: HarvardDecadacMock) -> None:
+    addrs = list(range(1536, 1536 + 40))
+    for addr in addrs:
+        dac.memory[addr] = addr
+
+    assert dac._query_addresses(addrs) == addrs
+    assert [cmd.count("p;") for cmd in dac.commands] == [16, 16, 8]
+
+    dac.commands.clear()
+    assert dac._query_addresses(addrs[:10], count=2) == [
+        (addr << 32) + addr + 1 for addr in addrs[:10]
+    ]
+    assert [cmd.count("p;") for cmd in dac.commands] == [16, 4]
+
+
+def test_query_nothing_sends_no_command(dac: HarvardDecadacMock) -> None:
+    assert dac._query_address(1536, count=0) == 0
+    assert dac._query_addresses([1536, 1537], count=0) == [0, 0]
+    assert dac._query_addresses([]) == []
+    assert dac.commands == []
+
+
+def test_channel_selection_is_cached(dac: HarvardDecadacMock) -> None:
+    chan = dac.channels[2]
+    chan.update_period.set(100)
+    chan.update_period.set(200)
+    chan.volt.set(1)
+    assert dac.commands == ["B0;C2;", "T100;", "T200;", "U65535;L0;D39321;"]
+
+    # selecting a slot on the root instrument invalidates the cache
+    dac.commands.clear()
+    dac.ask("B1;")
+    chan.update_period.set(100)
+    assert dac.commands == ["B1;", "B0;C2;", "T100;"]
+
+    # as does selecting another channel
+    dac.commands.clear()
+    dac.channels[5].update_period.set(100)
+    chan.update_period.set(100)
+    assert dac.commands == ["B1;C1;", "T100;", "B0;C2;", "T100;"]
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda dac, chan: chan.write("D0;"),
+        lambda dac, chan: dac.ask("B0;C2;D0;"),
+        lambda dac, chan: dac.write("B0;C2;D0;"),
+    ],
+)
+def test_ramp_after_external_write(dac: HarvardDecadacMock, write: Any) -> None:
+    chan = dac.channels[2]
+    dac.memory[chan._base_addr] = 1000  # update period
+    chan.volt.set(1)
+    # change the output behind the back of the volt parameter
+    write(dac, chan)
+    assert chan.volt.get() == -5
+
+    chan.enable_ramp(True)
+    dac.commands.clear()
+    chan.volt.set(1)
+    # the current value must be read and a ramp started
+    assert dac.commands[0] == f"A{chan._base_addr + 9};p;A{chan._base_addr};p;"
+    assert any(cmd.startswith("S") for cmd in dac.commands)
+
+    # the DAC is known to be at the voltage, so nothing is sent
+    dac.commands.clear()
+    chan.volt.set(1)
+    assert dac.commands == []
+
+
+def test_set_all_fast_is_chunked(dac: HarvardDecadacMock) -> None:
+    dac.set_all_fast(1)
+
+    # 5 commands per channel and at most 16 commands per transaction
+    assert [cmd.count(";") for cmd in dac.commands] == [15] * 6 + [10]
+    assert all(cmd.startswith("B") for cmd in dac.commands)
+    for chan in dac.channels:
+        assert chan.volt.cache.get(get_if_invalid=False) == 1
+        assert dac.memory[chan._base_addr + 9] == 39321
+
+
+def test_ramp_all_is_chunked(dac: HarvardDecadacMock) -> None:
+    dac.set_all_fast(0)
+    for chan in dac.channels:
+        dac.memory[chan._base_addr] = 1000  # update period
+    dac.commands.clear()
+
+    dac.ramp_all(1, 10)
+
+    ramp_cmds = [cmd for cmd in dac.commands if cmd.startswith("B")]
+    # 4 commands per channel and at most 16 commands per transaction
+    assert [cmd.count(";") for cmd in ramp_cmds] == [16] * 5
+    for chan in dac.channels:
+        assert chan.upper_ramp_limit.cache.get(get_if_invalid=False) == 1
+
+    dac.ramp_all(-1, 10)
+    for chan in dac.channels:
+        assert chan.lower_ramp_limit.cache.get(get_if_invalid=False) == -1
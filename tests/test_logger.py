@@ -8,6 +8,7 @@ from copy import copy
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pandas as pd
 import pytest
 from pytest import LogCaptureFixture
 
@@ -16,11 +17,18 @@ from qcodes import logger
 from qcodes.instrument import Instrument
 from qcodes.instrument_drivers.american_magnetics import AMIModel430, AMIModel4303D
 from qcodes.instrument_drivers.tektronix import TektronixAWG5208
-from qcodes.logger.log_analysis import capture_dataframe
+from qcodes.logger.log_analysis import (
+    capture_dataframe,
+    log_timestamps,
+    log_to_dataframe,
+    logfile_to_dataframe,
+    time_difference,
+)
 from tests.drivers.test_lakeshore_372 import LakeshoreModel372Mock
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
+    from pathlib import Path
 
 TEST_LOG_MESSAGE = "test log message"
 
@@ -231,6 +239,103 @@ def test_capture_dataframe() -> None:
     assert df.message[0] == TEST_LOG_MESSAGE
 
 
+def test_log_to_dataframe_skips_tracebacks() -> None:
+    sep = logger.logger.LOGGING_SEPARATOR
+    log = [
+        sep.join(["2024-01-01 10:00:00,000", "qcodes", "DEBUG", "m", "f", "1", "a"]),
+        "Traceback (most recent call last):",
+        '  File "<stdin>", line 1, in <module>',
+        sep.join(["2024-01-01 10:00:01,000", "qcodes", "INFO", "m", "f", "2", "b"]),
+    ]
+    df = log_to_dataframe(log)
+    assert list(df.columns) == list(logger.logger.FORMAT_STRING_DICT.keys())
+    assert list(df.message) == ["a", "b"]
+    assert list(df.levelname) == ["DEBUG", "INFO"]
+    assert log_to_dataframe("\n".join(log)).equals(df)
+    assert all(dtype == "string[pyarrow]" for dtype in df.dtypes)
+    assert log_timestamps(log).equals(df.asctime)
+
+
+def test_logfile_to_dataframe(tmp_path: "Path") -> None:
+    sep = logger.logger.LOGGING_SEPARATOR
+    logfile = tmp_path / "test.log"
+    logfile.write_text(
+        sep.join(["2024-01-01 10:00:00,000", "qcodes", "DEBUG", "m", "f", "1", "a"])
+        + "\nTraceback (most recent call last):\n"
+        + sep.join(["2024-01-01 10:00:01,000", "qcodes", "INFO", "m", "f", "2", "b"])
+        + "\n"
+    )
+    df = logfile_to_dataframe(str(logfile))
+    assert list(df.message) == ["a", "b"]
+    assert list(df.lineno) == ["1", "2"]
+
+
+@pytest.mark.parametrize("first", [True, False])
+def test_log_to_dataframe_separator_in_message(tmp_path: "Path", first: bool) -> None:
+    sep = logger.logger.LOGGING_SEPARATOR
+    lines = [
+        sep.join(["2024-01-01 10:00:00,000", "qcodes", "DEBUG", "m", "f", "1", "a"]),
+        sep.join(["2024-01-01 10:00:01,000", "qcodes", "INFO", "m", "f", "2", "b"])
+        + f"{sep}c\x1fd\x1e",
+    ]
+    if first:
+        lines.reverse()
+    logfile = tmp_path / "test.log"
+    logfile.write_text("\n".join(lines) + "\n")
+
+    for df in (log_to_dataframe(lines), logfile_to_dataframe(str(logfile))):
+        assert list(df.asctime) == [line[:23] for line in lines]
+        assert list(df.lineno) == (["2", "1"] if first else ["1", "2"])
+        messages = ["a", f"b{sep}c\x1fd\x1e"]
+        assert list(df.message) == (messages[::-1] if first else messages)
+
+
+def test_log_to_dataframe_carriage_return_in_message(tmp_path: "Path") -> None:
+    sep = logger.logger.LOGGING_SEPARATOR
+    lines = [
+        sep.join(["2024-01-01 10:00:00,000", "qcodes", "DEBUG", "m", "f", "1", ""])
+        + "resp: 1.0\rb",
+        sep.join(["2024-01-01 10:00:01,000", "qcodes", "INFO", "m", "f", "2", "c"]),
+    ]
+    log = "\r\n".join(lines) + "\r\n"
+    logfile = tmp_path / "test.log"
+    logfile.write_bytes(log.encode())
+
+    for df in (log_to_dataframe(log), logfile_to_dataframe(str(logfile))):
+        assert list(df.message) == ["resp: 1.0\rb", "c"]
+        assert list(df.lineno) == ["1", "2"]
+    assert log_timestamps(log).equals(log_to_dataframe(log).asctime)
+
+
+def test_time_difference() -> None:
+    firsttimes = pd.Series(
+        ["2024-01-01 10:00:00,123", "2024-01-01 10:00:01,000"], index=[3, 4]
+    )
+    secondtimes = pd.Series(
+        ["2024-01-01 10:00:00,223", "2024-01-01 10:00:02,500"], index=[7, 8]
+    )
+    diff = time_difference(firsttimes, secondtimes)
+    assert list(diff.index) == [3, 4]
+    np.testing.assert_allclose(diff.to_numpy(), [0.1, 1.5])
+
+    diff = time_difference(firsttimes, secondtimes, use_first_series_labels=False)
+    assert list(diff.index) == [7, 8]
+
+
+@pytest.mark.parametrize(
+    ("times", "expected"),
+    [
+        (["2024-01-01 10:00:00,500", "2024-01-01 10:00:01"], [0.5, 1]),
+        (["2024-01-01 10:00:00", "2024-01-01 10:00:01,250"], [0, 1.25]),
+        (["2024-01-01 10:00:00.5", "2024-01-01T10:00:01"], [0.5, 1]),
+    ],
+)
+def test_time_difference_mixed_formats(times: list[str], expected: list[float]) -> None:
+    firsttimes = pd.Series(["2024-01-01 10:00:00,000"] * 2)
+    diff = time_difference(firsttimes, pd.Series(times))
+    np.testing.assert_allclose(diff.to_numpy(), expected)
+
+
 def test_channels(model372: LakeshoreModel372Mock) -> None:
     """
     Test that messages logged in a channel are propagated to the